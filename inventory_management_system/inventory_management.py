@@ -1,7 +1,10 @@
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 import json
-from datetime import datetime
+import re
+import sys
+from datetime import date, datetime, time
 
 # Custom Exceptions
 class DuplicateProductIDException(Exception):
@@ -13,77 +16,201 @@ class InsufficientStockException(Exception):
 class InvalidProductDataException(Exception):
     pass
 
+def _display_attr(name):
+    # Public attribute shown by __str__; assigning it clears the cached string.
+    slot = "_" + name
+
+    def fset(self, value):
+        setattr(self, slot, value)
+        self._str_cache = None
+
+    return property(lambda self: getattr(self, slot), fset)
+
 # Abstract Base Class
 class Product(ABC):
+    __slots__ = ('_product_id', '_name', '_price', '_quantity_in_stock', '_name_lower', '_str_cache')
+
     def __init__(self, product_id, name, price, quantity_in_stock):
         self._product_id = product_id
         self._name = name
         self._price = price
         self._quantity_in_stock = quantity_in_stock
+        self._name_lower = name.lower()
+        self._str_cache = None
 
     def restock(self, amount):
         self._quantity_in_stock += amount
+        self._str_cache = None
 
     def sell(self, quantity):
         if quantity > self._quantity_in_stock:
             raise InsufficientStockException("Not enough stock to sell.")
         self._quantity_in_stock -= quantity
+        self._str_cache = None
 
     def get_total_value(self):
         return self._price * self._quantity_in_stock
 
+    def _extra_fields(self):
+        return {}
+
     @abstractmethod
     def __str__(self):
         pass
 
+# fromisoformat is much faster than strptime but also accepts times, offsets and
+# week dates, so it only handles the strict YYYY-MM-DD shape; strptime keeps the
+# rest (e.g. "2025-1-5") so the accepted inputs stay exactly the same.
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+def _parse_date(text):
+    if _ISO_DATE.fullmatch(text):
+        return datetime.combine(date.fromisoformat(text), time())
+    return datetime.strptime(text, "%Y-%m-%d")
+
 # Subclasses
 class Electronics(Product):
+    __slots__ = ('_warranty_years', '_brand')
+
+    warranty_years = _display_attr('warranty_years')
+    brand = _display_attr('brand')
+
     def __init__(self, product_id, name, price, quantity_in_stock, warranty_years, brand):
         super().__init__(product_id, name, price, quantity_in_stock)
         self.warranty_years = warranty_years
         self.brand = brand
 
+    def _extra_fields(self):
+        return {"warranty_years": self.warranty_years, "brand": self.brand}
+
     def __str__(self):
-        return f"[Electronics] {self._name} (ID: {self._product_id}, Brand: {self.brand}, Warranty: {self.warranty_years} yrs, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"[Electronics] {self._name} (ID: {self._product_id}, Brand: {self.brand}, Warranty: {self.warranty_years} yrs, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        return s
 
 class Grocery(Product):
+    __slots__ = ('_expiry_date',)
+
+    expiry_date = _display_attr('expiry_date')
+
     def __init__(self, product_id, name, price, quantity_in_stock, expiry_date):
         super().__init__(product_id, name, price, quantity_in_stock)
-        self.expiry_date = datetime.strptime(expiry_date, "%Y-%m-%d")
+        self.expiry_date = _parse_date(expiry_date)
+
+    def is_expired(self, now=None):
+        if now is None:
+            now = datetime.now()
+        return now > self.expiry_date
 
-    def is_expired(self):
-        return datetime.now() > self.expiry_date
+    def _extra_fields(self):
+        return {"expiry_date": self.expiry_date.date().isoformat()}
 
     def __str__(self):
-        return f"[Grocery] {self._name} (ID: {self._product_id}, Expiry: {self.expiry_date.date()}, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"[Grocery] {self._name} (ID: {self._product_id}, Expiry: {self.expiry_date.date()}, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        return s
 
 class Clothing(Product):
+    __slots__ = ('_size', '_material')
+
+    size = _display_attr('size')
+    material = _display_attr('material')
+
     def __init__(self, product_id, name, price, quantity_in_stock, size, material):
         super().__init__(product_id, name, price, quantity_in_stock)
         self.size = size
         self.material = material
 
+    def _extra_fields(self):
+        return {"size": self.size, "material": self.material}
+
     def __str__(self):
-        return f"[Clothing] {self._name} (ID: {self._product_id}, Size: {self.size}, Material: {self.material}, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"[Clothing] {self._name} (ID: {self._product_id}, Size: {self.size}, Material: {self.material}, Price: {self._price}, Stock: {self._quantity_in_stock})"
+        return s
+
+# type name -> (class, serialized keys in constructor order); keys not listed are ignored
+_CTORS = {
+    "Electronics": (Electronics, ("product_id", "name", "price", "quantity_in_stock", "warranty_years", "brand")),
+    "Grocery": (Grocery, ("product_id", "name", "price", "quantity_in_stock", "expiry_date")),
+    "Clothing": (Clothing, ("product_id", "name", "price", "quantity_in_stock", "size", "material")),
+}
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 # Inventory Class
 class Inventory:
     def __init__(self):
         self._products = {}
+        # trigram -> {product_id: None}; dicts keep posting lists in insertion order
+        self._trigram_index = defaultdict(dict)
+        # product class -> {product_id: product}
+        self._by_type = defaultdict(dict)
+
+    def _index(self, product):
+        pid = product._product_id
+        for tri in _trigrams(product._name_lower):
+            self._trigram_index[tri][pid] = None
+        self._by_type[type(product)][pid] = product
+
+    def _unindex(self, product):
+        pid = product._product_id
+        for tri in _trigrams(product._name_lower):
+            posting = self._trigram_index.get(tri)
+            if posting is not None:
+                posting.pop(pid, None)
+                if not posting:
+                    del self._trigram_index[tri]
+        bucket = self._by_type.get(type(product))
+        if bucket is not None:
+            bucket.pop(pid, None)
+            if not bucket:
+                del self._by_type[type(product)]
+
+    def _rebuild_indexes(self):
+        self._trigram_index = defaultdict(dict)
+        self._by_type = defaultdict(dict)
+        for p in self._products.values():
+            self._index(p)
 
     def add_product(self, product):
         if product._product_id in self._products:
             raise DuplicateProductIDException("Product with this ID already exists.")
         self._products[product._product_id] = product
+        self._index(product)
 
     def remove_product(self, product_id):
-        self._products.pop(product_id, None)
+        product = self._products.pop(product_id, None)
+        if product is not None:
+            self._unindex(product)
 
     def search_by_name(self, name):
-        return [p for p in self._products.values() if name.lower() in p._name.lower()]
+        query = name.lower()
+        if len(query) < 3:
+            return [p for p in self._products.values() if query in p._name_lower]
+        postings = [self._trigram_index.get(tri) for tri in _trigrams(query)]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+        results = []
+        for pid in smallest:
+            if all(pid in posting for posting in rest):
+                p = self._products[pid]
+                if query in p._name_lower:
+                    results.append(p)
+        return results
 
     def search_by_type(self, product_type):
-        return [p for p in self._products.values() if isinstance(p, product_type)]
+        buckets = [bucket for cls, bucket in self._by_type.items() if issubclass(cls, product_type)]
+        if len(buckets) > 1:
+            # several classes match; scan to keep results in insertion order
+            return [p for p in self._products.values() if isinstance(p, product_type)]
+        return list(buckets[0].values()) if buckets else []
 
     def list_all_products(self):
         return list(self._products.values())
@@ -97,22 +224,31 @@ class Inventory:
             self._products[product_id].restock(quantity)
 
     def total_inventory_value(self):
-        return sum(p.get_total_value() for p in self._products.values())
+        return sum(p._price * p._quantity_in_stock for p in self._products.values())
 
     def remove_expired_products(self):
-        expired_ids = [pid for pid, p in self._products.items() if isinstance(p, Grocery) and p.is_expired()]
+        now = datetime.now()
+        expired_ids = [p._product_id for p in self.search_by_type(Grocery) if now > p.expiry_date]
         for pid in expired_ids:
-            del self._products[pid]
+            self.remove_product(pid)
 
     def save_to_file(self, filename):
+        payload = json.dumps({pid: self.serialize_product(p) for pid, p in self._products.items()}, separators=(',', ':'))
         with open(filename, 'w') as f:
-            json.dump({pid: self.serialize_product(p) for pid, p in self._products.items()}, f, indent=4)
+            f.write(payload)
 
     def load_from_file(self, filename):
         try:
             with open(filename, 'r') as f:
                 data = json.load(f)
-            self._products = {pid: self.deserialize_product(info) for pid, info in data.items()}
+            products = {}
+            for info in data.values():
+                product = self.deserialize_product(info)
+                if product._product_id in products:
+                    raise DuplicateProductIDException("Product with this ID already exists.")
+                products[product._product_id] = product
+            self._products = products
+            self._rebuild_indexes()
         except Exception as e:
             raise InvalidProductDataException(f"Error loading file: {e}")
 
@@ -124,24 +260,19 @@ class Inventory:
             "price": product._price,
             "quantity_in_stock": product._quantity_in_stock
         }
-        if isinstance(product, Electronics):
-            base.update({"warranty_years": product.warranty_years, "brand": product.brand})
-        elif isinstance(product, Grocery):
-            base.update({"expiry_date": product.expiry_date.strftime("%Y-%m-%d")})
-        elif isinstance(product, Clothing):
-            base.update({"size": product.size, "material": product.material})
+        base.update(product._extra_fields())
         return base
 
     def deserialize_product(self, data):
-        t = data["type"]
-        if t == "Electronics":
-            return Electronics(data["product_id"], data["name"], data["price"], data["quantity_in_stock"], data["warranty_years"], data["brand"])
-        elif t == "Grocery":
-            return Grocery(data["product_id"], data["name"], data["price"], data["quantity_in_stock"], data["expiry_date"])
-        elif t == "Clothing":
-            return Clothing(data["product_id"], data["name"], data["price"], data["quantity_in_stock"], data["size"], data["material"])
-        else:
+        ctor = _CTORS.get(data["type"])
+        if ctor is None:
             raise InvalidProductDataException("Unknown product type.")
+        cls, fields = ctor
+        return cls(*[data[f] for f in fields])
+
+def _print_products(products, chunk_size=1000):
+    for start in range(0, len(products), chunk_size):
+        sys.stdout.write("\n".join(map(str, products[start:start + chunk_size])) + "\n")
 
 # CLI Interface
 if __name__ == "__main__":
@@ -190,14 +321,11 @@ if __name__ == "__main__":
                 print("Product sold.")
 
             elif choice == '3':
-                for p in inventory.list_all_products():
-                    print(p)
+                _print_products(inventory.list_all_products())
 
             elif choice == '4':
                 name = input("Enter name to search: ")
-                results = inventory.search_by_name(name)
-                for r in results:
-                    print(r)
+                _print_products(inventory.search_by_name(name))
 
             elif choice == '5':
                 fname = input("Enter filename to save: ")
@@ -1,80 +1,196 @@
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime, time
 import json
+import re
+import sys
+
+def _display_attr(name):
+    # Public attribute shown by __str__; assigning it clears the cached string.
+    slot = "_" + name
+
+    def fset(self, value):
+        setattr(self, slot, value)
+        self._str_cache = None
+
+    return property(lambda self: getattr(self, slot), fset)
 
 # Abstract Product Class
 class Product(ABC):
+    __slots__ = ("_product_id", "_name", "_price", "_quantity_in_stock", "_name_lower", "_str_cache")
+
     def __init__(self, product_id, name, price, quantity_in_stock):
         self._product_id = product_id
         self._name = name
         self._price = price
         self._quantity_in_stock = quantity_in_stock
+        self._name_lower = name.lower()
+        self._str_cache = None
 
     def restock(self, amount):
         self._quantity_in_stock += amount
+        self._str_cache = None
 
     def sell(self, quantity):
         if quantity > self._quantity_in_stock:
             raise ValueError(f"Only {self._quantity_in_stock} items available.")
         self._quantity_in_stock -= quantity
+        self._str_cache = None
 
     def get_total_value(self):
         return self._price * self._quantity_in_stock
 
+    def _extra_fields(self):
+        return {}
+
     @abstractmethod
     def __str__(self):
         pass
 
+# fromisoformat is much faster than strptime but also accepts times, offsets and
+# week dates, so it only handles the strict YYYY-MM-DD shape; strptime keeps the
+# rest (e.g. "2025-1-5") so the accepted inputs stay exactly the same.
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+
+def _parse_date(text):
+    if _ISO_DATE.fullmatch(text):
+        return datetime.combine(date.fromisoformat(text), time())
+    return datetime.strptime(text, "%Y-%m-%d")
+
 # Subclasses
 class Electronics(Product):
+    __slots__ = ("_warranty_years", "_brand")
+
+    warranty_years = _display_attr("warranty_years")
+    brand = _display_attr("brand")
+
     def __init__(self, product_id, name, price, quantity, brand, warranty_years):
         super().__init__(product_id, name, price, quantity)
         self.brand = brand
         self.warranty_years = warranty_years
 
+    def _extra_fields(self):
+        return {"brand": self.brand, "warranty_years": self.warranty_years}
+
     def __str__(self):
-        return f"[Electronics] ID: {self._product_id}, Name: {self._name}, Brand: {self.brand}, Price: {self._price}, Qty: {self._quantity_in_stock}, Warranty: {self.warranty_years} years"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"[Electronics] ID: {self._product_id}, Name: {self._name}, Brand: {self.brand}, Price: {self._price}, Qty: {self._quantity_in_stock}, Warranty: {self.warranty_years} years"
+        return s
 
 class Grocery(Product):
+    __slots__ = ("expiry_date",)
+
     def __init__(self, product_id, name, price, quantity, expiry_date):
         super().__init__(product_id, name, price, quantity)
-        self.expiry_date = datetime.strptime(expiry_date, "%Y-%m-%d")
+        self.expiry_date = _parse_date(expiry_date)
+
+    def is_expired(self, now=None):
+        if now is None:
+            now = datetime.now()
+        return now > self.expiry_date
 
-    def is_expired(self):
-        return datetime.now() > self.expiry_date
+    def _extra_fields(self):
+        return {"expiry_date": self.expiry_date.date().isoformat()}
 
     def __str__(self):
         status = "Expired" if self.is_expired() else "Fresh"
         return f"[Grocery] ID: {self._product_id}, Name: {self._name}, Price: {self._price}, Qty: {self._quantity_in_stock}, Expiry: {self.expiry_date.date()} ({status})"
 
 class Clothing(Product):
+    __slots__ = ("_size", "_material")
+
+    size = _display_attr("size")
+    material = _display_attr("material")
+
     def __init__(self, product_id, name, price, quantity, size, material):
         super().__init__(product_id, name, price, quantity)
         self.size = size
         self.material = material
 
+    def _extra_fields(self):
+        return {"size": self.size, "material": self.material}
+
     def __str__(self):
-        return f"[Clothing] ID: {self._product_id}, Name: {self._name}, Price: {self._price}, Qty: {self._quantity_in_stock}, Size: {self.size}, Material: {self.material}"
+        s = self._str_cache
+        if s is None:
+            s = self._str_cache = f"[Clothing] ID: {self._product_id}, Name: {self._name}, Price: {self._price}, Qty: {self._quantity_in_stock}, Size: {self.size}, Material: {self.material}"
+        return s
+
+_CTORS = {"Electronics": Electronics, "Grocery": Grocery, "Clothing": Clothing}
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 # Inventory Class
 class Inventory:
     def __init__(self):
         self._products = {}
+        # trigram -> {product_id: None}; dicts keep posting lists in insertion order
+        self._trigram_index = defaultdict(dict)
+        # product class -> {product_id: product}
+        self._by_type = defaultdict(dict)
+
+    def _index(self, product):
+        pid = product._product_id
+        for tri in _trigrams(product._name_lower):
+            self._trigram_index[tri][pid] = None
+        self._by_type[type(product)][pid] = product
+
+    def _unindex(self, product):
+        pid = product._product_id
+        for tri in _trigrams(product._name_lower):
+            posting = self._trigram_index.get(tri)
+            if posting is not None:
+                posting.pop(pid, None)
+                if not posting:
+                    del self._trigram_index[tri]
+        bucket = self._by_type.get(type(product))
+        if bucket is not None:
+            bucket.pop(pid, None)
+            if not bucket:
+                del self._by_type[type(product)]
+
+    def _rebuild_indexes(self):
+        self._trigram_index = defaultdict(dict)
+        self._by_type = defaultdict(dict)
+        for p in self._products.values():
+            self._index(p)
 
     def add_product(self, product):
         if product._product_id in self._products:
             raise ValueError("Duplicate product ID.")
         self._products[product._product_id] = product
+        self._index(product)
 
     def remove_product(self, product_id):
         if product_id in self._products:
-            del self._products[product_id]
+            self._unindex(self._products.pop(product_id))
 
     def search_by_name(self, name):
-        return [p for p in self._products.values() if name.lower() in p._name.lower()]
+        query = name.lower()
+        if len(query) < 3:
+            return [p for p in self._products.values() if query in p._name_lower]
+        postings = [self._trigram_index.get(tri) for tri in _trigrams(query)]
+        if not all(postings):
+            return []
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+        results = []
+        for pid in smallest:
+            if all(pid in posting for posting in rest):
+                p = self._products[pid]
+                if query in p._name_lower:
+                    results.append(p)
+        return results
 
     def search_by_type(self, product_type):
-        return [p for p in self._products.values() if p.__class__.__name__.lower() == product_type.lower()]
+        product_type = product_type.lower()
+        buckets = [bucket for cls, bucket in self._by_type.items() if cls.__name__.lower() == product_type]
+        if len(buckets) > 1:
+            # several classes share the name; scan to keep results in insertion order
+            return [p for p in self._products.values() if p.__class__.__name__.lower() == product_type]
+        return list(buckets[0].values()) if buckets else []
 
     def list_all_products(self):
         return list(self._products.values())
@@ -90,44 +206,54 @@ class Inventory:
         self._products[product_id].restock(quantity)
 
     def total_inventory_value(self):
-        return sum(p.get_total_value() for p in self._products.values())
+        return sum(p._price * p._quantity_in_stock for p in self._products.values())
 
     def remove_expired_products(self):
-        expired_ids = [pid for pid, p in self._products.items()
-                       if isinstance(p, Grocery) and p.is_expired()]
+        now = datetime.now()
+        expired_ids = [pid for cls, bucket in self._by_type.items() if issubclass(cls, Grocery)
+                       for pid, p in bucket.items() if now > p.expiry_date]
         for pid in expired_ids:
-            del self._products[pid]
+            self.remove_product(pid)
 
     def save_to_file(self, filename):
         data = []
         for p in self._products.values():
-            p_data = p.__dict__.copy()
-            p_data["type"] = p.__class__.__name__
-            if isinstance(p, Grocery):
-                p_data["expiry_date"] = p.expiry_date.strftime("%Y-%m-%d")
+            p_data = {
+                "type": p.__class__.__name__,
+                "product_id": p._product_id,
+                "name": p._name,
+                "price": p._price,
+                "quantity": p._quantity_in_stock,
+            }
+            p_data.update(p._extra_fields())
             data.append(p_data)
+        payload = json.dumps(data, separators=(",", ":"))
         with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
+            f.write(payload)
 
     def load_from_file(self, filename):
         try:
             with open(filename, "r") as f:
                 data = json.load(f)
-            self._products = {}
+            products = {}
             for item in data:
                 type_ = item.pop("type")
-                if type_ == "Electronics":
-                    obj = Electronics(**item)
-                elif type_ == "Grocery":
-                    obj = Grocery(**item)
-                elif type_ == "Clothing":
-                    obj = Clothing(**item)
-                else:
+                cls = _CTORS.get(type_)
+                if cls is None:
                     raise ValueError(f"Unknown product type: {type_}")
-                self._products[obj._product_id] = obj
+                obj = cls(**item)
+                if obj._product_id in products:
+                    raise ValueError("Duplicate product ID.")
+                products[obj._product_id] = obj
+            self._products = products
+            self._rebuild_indexes()
         except Exception as e:
             raise ValueError("Failed to load inventory data.") from e
 
+def _print_products(products, chunk_size=1000):
+    for start in range(0, len(products), chunk_size):
+        sys.stdout.write("\n".join(map(str, products[start:start + chunk_size])) + "\n")
+
 # CLI Menu
 def cli():
     inv = Inventory()
@@ -175,12 +301,9 @@ def cli():
                 inv.sell_product(pid, qty)
             elif choice == "3":
                 name = input("Enter product name to search: ")
-                results = inv.search_by_name(name)
-                for p in results:
-                    print(p)
+                _print_products(inv.search_by_name(name))
             elif choice == "4":
-                for p in inv.list_all_products():
-                    print(p)
+                _print_products(inv.list_all_products())
             elif choice == "5":
                 inv.save_to_file("inventory.json")
                 print("Inventory saved.")
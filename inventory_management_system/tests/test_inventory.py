@@ -0,0 +1,148 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "inventory_management_system"))
+
+from inventory import Clothing, Electronics, Grocery, Inventory, Product
+
+
+class Perishable(Grocery):
+    __slots__ = ()
+
+
+NAMES = ["Laptop", "Milk", "Almond Milk", "T-Shirt", "Shirt Dress", "lap desk", "Mi", "Oat milk"]
+QUERIES = ["", "m", "mi", "milk", "MILK", "shirt", "lap", "top", "desk", "xyz", "k d"]
+
+
+def linear_search(inventory, name):
+    return [p for p in inventory.list_all_products() if name.lower() in p._name.lower()]
+
+
+class NameIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.inventory = Inventory()
+        for i, name in enumerate(NAMES):
+            if i % 3 == 0:
+                p = Electronics(f"e{i}", name, 100.0, 2, "Acme", 1)
+            elif i % 3 == 1:
+                p = Grocery(f"g{i}", name, 2.5, 10, "2000-01-01" if i % 2 else "2999-01-01")
+            else:
+                p = Clothing(f"c{i}", name, 20.0, 5, "M", "Cotton")
+            self.inventory.add_product(p)
+
+    def assertMatchesLinearScan(self):
+        for q in QUERIES:
+            self.assertEqual(self.inventory.search_by_name(q), linear_search(self.inventory, q), q)
+
+    def test_add(self):
+        self.assertMatchesLinearScan()
+
+    def test_remove(self):
+        self.inventory.remove_product("e0")
+        self.inventory.remove_product("c2")
+        self.assertMatchesLinearScan()
+        self.inventory.add_product(Electronics("e0", "Laptop", 100.0, 2, "Acme", 1))
+        self.assertMatchesLinearScan()
+
+    def test_remove_expired(self):
+        self.inventory.remove_expired_products()
+        self.assertMatchesLinearScan()
+
+    def test_save_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "inventory.json")
+            self.inventory.save_to_file(filename)
+            loaded = Inventory()
+            loaded.load_from_file(filename)
+        self.assertEqual([str(p) for p in loaded.list_all_products()],
+                         [str(p) for p in self.inventory.list_all_products()])
+        self.inventory = loaded
+        self.assertMatchesLinearScan()
+
+    def test_load_rejects_duplicate_product_ids(self):
+        item = {"type": "Clothing", "product_id": "c1", "name": "Shirt", "price": 5.0,
+                "quantity": 1, "size": "M", "material": "Cotton"}
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "inventory.json")
+            with open(filename, "w") as f:
+                json.dump([item, dict(item, name="Other")], f)
+            with self.assertRaises(ValueError):
+                self.inventory.load_from_file(filename)
+        self.assertEqual(len(self.inventory.list_all_products()), len(NAMES))
+        self.assertMatchesLinearScan()
+
+
+class StrCacheTest(unittest.TestCase):
+    def test_str_follows_stock_changes(self):
+        p = Clothing("c1", "Shirt", 5.0, 3, "M", "Cotton")
+        str(p)
+        p.sell(1)
+        self.assertIn("Qty: 2", str(p))
+
+    def test_str_follows_attribute_changes(self):
+        e = Electronics("e1", "Laptop", 100.0, 2, "Acme", 1)
+        c = Clothing("c1", "Shirt", 5.0, 3, "M", "Cotton")
+        str(e), str(c)
+        e.brand = "Globex"
+        e.warranty_years = 7
+        c.size = "XL"
+        c.material = "Linen"
+        self.assertIn("Globex", str(e))
+        self.assertIn("7", str(e))
+        self.assertIn("XL", str(c))
+        self.assertIn("Linen", str(c))
+
+
+class ExpiryDateTest(unittest.TestCase):
+    def test_accepts_same_inputs_as_strptime(self):
+        for text in ["2025-01-05", "2025-1-5", "2000-01-01T00:00+00:00", "2025-01-05T12:30",
+                     "20250105", "2025-W01-1", "2025-02-30"]:
+            try:
+                expected = datetime.strptime(text, "%Y-%m-%d")
+            except ValueError:
+                with self.assertRaises(ValueError):
+                    Grocery("g1", "Milk", 1.0, 1, text)
+            else:
+                self.assertEqual(Grocery("g1", "Milk", 1.0, 1, text).expiry_date, expected)
+
+    def test_expiry_date_is_naive(self):
+        self.assertIsNone(Grocery("g1", "Milk", 1.0, 1, "2025-01-05").expiry_date.tzinfo)
+
+
+class ExpirySweepTest(unittest.TestCase):
+    def test_removes_expired_grocery_subclasses(self):
+        inventory = Inventory()
+        inventory.add_product(Grocery("g1", "Milk", 1.0, 1, "2000-01-01"))
+        inventory.add_product(Perishable("p1", "Fish", 1.0, 1, "2000-01-01"))
+        inventory.add_product(Perishable("p2", "Bread", 1.0, 1, "2999-01-01"))
+        inventory.remove_expired_products()
+        self.assertEqual([p._product_id for p in inventory.list_all_products()], ["p2"])
+
+
+class SearchByTypeTest(unittest.TestCase):
+    def test_matches_class_name_in_insertion_order(self):
+        inventory = Inventory()
+        inventory.add_product(Electronics("e1", "Laptop", 100.0, 1, "Acme", 1))
+        inventory.add_product(Grocery("g1", "Milk", 1.0, 1, "2999-01-01"))
+        inventory.add_product(Electronics("e2", "Phone", 50.0, 1, "Acme", 1))
+        self.assertEqual([p._product_id for p in inventory.search_by_type("electronics")], ["e1", "e2"])
+        self.assertEqual(inventory.search_by_type("clothing"), [])
+
+
+class ProductSubclassTest(unittest.TestCase):
+    def test_subclass_without_extra_fields(self):
+        class Gadget(Product):
+            def __str__(self):
+                return self._name
+
+        inventory = Inventory()
+        inventory.add_product(Gadget("x1", "Gadget", 1.0, 1))
+        self.assertEqual(inventory.search_by_name("gad")[0]._extra_fields(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()